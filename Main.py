@@ -1,436 +1,701 @@
 import asyncio
-import os
-from typing import Any, Optional
-from datetime import datetime, timedelta
-import httpx
-from bs4 import BeautifulSoup
+from typing import Optional
 from urllib.parse import urlencode, quote_plus
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import Tool
 import mcp.types as types
-import json
+import random
 import re
+import time
+from collections import Counter
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+_BASE_URL = "https://www.linkedin.com"
+_SEARCH_PATH = "/jobs/search/"
+_SEARCH_URL = f"{_BASE_URL}{_SEARCH_PATH}"
+
+# Result pages fetched per market analysis (25 listings each)
+_ANALYSIS_PAGES = 8
+
+# Card selectors tried in order on listing pages
+_CARD_SELECTORS = ('div.base-card', 'li.jobs-search__results-list')
+
+# Matches job IDs in both /jobs/view/ URLs and currentJobId= query params
+_JOB_ID_RE = re.compile(r'(?:/jobs/view/|currentJobId=)(\d+)')
+
+# Transient statuses worth retrying: throttling and upstream hiccups
+_RETRY_STATUSES = {429, 502, 503, 504}
+
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Backoff delay for a retry, honoring a Retry-After header when present"""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return min(2 ** attempt, 30) + random.random() * 0.25
+
+# Job-detail fields keyed by tag: (class marker, field name)
+_DETAIL_FIELDS = {
+    'h1': ('top-card-layout__title', 'title'),
+    'a': ('topcard__org-name-link', 'company'),
+    'span': ('topcard__flavor--bullet', 'location'),
+    'div': ('show-more-less-html__markup', 'description')
+}
+
+# LinkedIn job search filter parameters, built once at import
+_TIME_FILTER = {
+    "past_24h": "r86400",
+    "past_week": "r604800",
+    "past_month": "r2592000",
+    "any_time": ""
+}
+
+_EXPERIENCE_LEVEL = {
+    "internship": "1",
+    "entry_level": "2",
+    "associate": "3",
+    "mid_senior": "4",
+    "director": "5",
+    "executive": "6"
+}
+
+_JOB_TYPE = {
+    "full_time": "F",
+    "part_time": "P",
+    "contract": "C",
+    "temporary": "T",
+    "internship": "I",
+    "volunteer": "V"
+}
+
+_SEARCH_JOBS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "keywords": {
+            "type": "string",
+            "description": "Job search keywords (e.g., 'AI Engineer', 'Machine Learning', 'Data Scientist')"
+        },
+        "location": {
+            "type": "string",
+            "description": "Location for the job search (e.g., 'San Francisco', 'Remote', 'India')"
+        },
+        "experience_level": {
+            "type": "string",
+            "enum": ["internship", "entry_level", "associate", "mid_senior", "director", "executive"],
+            "description": "Experience level: internship, entry_level (0-2 yrs), associate (2-5 yrs), mid_senior, director, executive"
+        },
+        "posted_time": {
+            "type": "string",
+            "enum": ["past_24h", "past_week", "past_month", "any_time"],
+            "description": "When the job was posted",
+            "default": "past_month"
+        },
+        "job_type": {
+            "type": "string",
+            "enum": ["full_time", "part_time", "contract", "temporary", "internship", "volunteer"],
+            "description": "Type of employment"
+        },
+        "remote": {
+            "type": "boolean",
+            "description": "Filter for remote jobs only"
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of results to return",
+            "minimum": 1,
+            "maximum": 100,
+            "default": 25
+        }
+    },
+    "required": ["keywords"]
+}
+
+_GET_JOB_DETAILS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "job_url_or_id": {
+            "type": "string",
+            "description": "LinkedIn job URL or job ID (e.g., 'https://www.linkedin.com/jobs/view/3812345678' or just '3812345678')"
+        }
+    },
+    "required": ["job_url_or_id"]
+}
+
+_SEARCH_COMPANIES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "company_name": {
+            "type": "string",
+            "description": "Company name to search for"
+        }
+    },
+    "required": ["company_name"]
+}
+
+_GET_COMPANY_JOBS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "company_name": {
+            "type": "string",
+            "description": "Company name (e.g., 'Google', 'Microsoft')"
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of jobs to return",
+            "minimum": 1,
+            "maximum": 100,
+            "default": 25
+        }
+    },
+    "required": ["company_name"]
+}
+
+_ANALYZE_JOB_MARKET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "role": {
+            "type": "string",
+            "description": "Job role to analyze (e.g., 'AI Engineer', 'Data Scientist')"
+        },
+        "location": {
+            "type": "string",
+            "description": "Location for analysis (optional)"
+        }
+    },
+    "required": ["role"]
+}
+
+# Tool definitions are immutable and shared across list_tools calls,
+# so build them once at import
+_TOOLS = [
+    Tool(
+        name="search_jobs",
+        description="Search for job postings on LinkedIn. Can filter by keywords, location, experience level, and recency. Works without API keys by scraping public job listings.",
+        inputSchema=_SEARCH_JOBS_SCHEMA
+    ),
+    Tool(
+        name="get_job_details",
+        description="Get detailed information about a specific LinkedIn job posting using its job ID or URL",
+        inputSchema=_GET_JOB_DETAILS_SCHEMA
+    ),
+    Tool(
+        name="search_companies",
+        description="Search for companies on LinkedIn by name",
+        inputSchema=_SEARCH_COMPANIES_SCHEMA
+    ),
+    Tool(
+        name="get_company_jobs",
+        description="Get all active job postings from a specific company",
+        inputSchema=_GET_COMPANY_JOBS_SCHEMA
+    ),
+    Tool(
+        name="analyze_job_market",
+        description="Analyze job market trends for specific roles including posting counts, top companies, and location distribution",
+        inputSchema=_ANALYZE_JOB_MARKET_SCHEMA
+    ),
+]
+
+class RateLimiter:
+    """Token-bucket limiter to keep outbound request rate below LinkedIn's throttle"""
+
+    def __init__(self, requests_per_second: float, burst: int = 5):
+        self.rate = requests_per_second
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
 
 class LinkedInMCPServer:
     def __init__(self):
+        # Heavy third-party imports are deferred to server construction so
+        # that importing this module stays cheap (e.g. for tooling or tests)
+        global httpx, etree, HTMLParser
+        import httpx
+        from lxml import etree
+        from selectolax.parser import HTMLParser
+
         self.server = Server("linkedin-mcp-server")
         self.http_client = httpx.AsyncClient(
+            http2=True,
+            base_url=_BASE_URL,
             headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             },
             follow_redirects=True,
-            timeout=30.0
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0
+            )
         )
+        self._cache: dict[str, tuple[float, str]] = {}
+        self._cache_ttl = 300.0
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._limiter = RateLimiter(requests_per_second=5)
+        # Bounds total in-flight fetches across all concurrent fan-outs
+        self._fanout_sem = asyncio.Semaphore(16)
+        self._dispatch = {
+            "search_jobs": self._search_jobs,
+            "get_job_details": self._get_job_details,
+            "search_companies": self._search_companies,
+            "get_company_jobs": self._get_company_jobs,
+            "analyze_job_market": self._analyze_job_market
+        }
         self._setup_handlers()
-    
+
     def _setup_handlers(self):
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
-            return [
-                Tool(
-                    name="search_jobs",
-                    description="Search for job postings on LinkedIn. Can filter by keywords, location, experience level, and recency. Works without API keys by scraping public job listings.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "keywords": {
-                                "type": "string",
-                                "description": "Job search keywords (e.g., 'AI Engineer', 'Machine Learning', 'Data Scientist')"
-                            },
-                            "location": {
-                                "type": "string",
-                                "description": "Location for the job search (e.g., 'San Francisco', 'Remote', 'India')"
-                            },
-                            "experience_level": {
-                                "type": "string",
-                                "enum": ["internship", "entry_level", "associate", "mid_senior", "director", "executive"],
-                                "description": "Experience level: internship, entry_level (0-2 yrs), associate (2-5 yrs), mid_senior, director, executive"
-                            },
-                            "posted_time": {
-                                "type": "string",
-                                "enum": ["past_24h", "past_week", "past_month", "any_time"],
-                                "description": "When the job was posted",
-                                "default": "past_month"
-                            },
-                            "job_type": {
-                                "type": "string",
-                                "enum": ["full_time", "part_time", "contract", "temporary", "internship", "volunteer"],
-                                "description": "Type of employment"
-                            },
-                            "remote": {
-                                "type": "boolean",
-                                "description": "Filter for remote jobs only"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results to return",
-                                "default": 25
-                            }
-                        },
-                        "required": ["keywords"]
-                    }
-                ),
-                Tool(
-                    name="get_job_details",
-                    description="Get detailed information about a specific LinkedIn job posting using its job ID or URL",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "job_url_or_id": {
-                                "type": "string",
-                                "description": "LinkedIn job URL or job ID (e.g., 'https://www.linkedin.com/jobs/view/3812345678' or just '3812345678')"
-                            }
-                        },
-                        "required": ["job_url_or_id"]
-                    }
-                ),
-                Tool(
-                    name="search_companies",
-                    description="Search for companies on LinkedIn by name",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "company_name": {
-                                "type": "string",
-                                "description": "Company name to search for"
-                            }
-                        },
-                        "required": ["company_name"]
-                    }
-                ),
-                Tool(
-                    name="get_company_jobs",
-                    description="Get all active job postings from a specific company",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "company_name": {
-                                "type": "string",
-                                "description": "Company name (e.g., 'Google', 'Microsoft')"
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of jobs to return",
-                                "default": 25
-                            }
-                        },
-                        "required": ["company_name"]
-                    }
-                ),
-                Tool(
-                    name="analyze_job_market",
-                    description="Analyze job market trends for specific roles including posting counts, top companies, and location distribution",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "role": {
-                                "type": "string",
-                                "description": "Job role to analyze (e.g., 'AI Engineer', 'Data Scientist')"
-                            },
-                            "location": {
-                                "type": "string",
-                                "description": "Location for analysis (optional)"
-                            }
-                        },
-                        "required": ["role"]
-                    }
-                )
-            ]
-        
+            return _TOOLS
+
         @self.server.call_tool()
         async def handle_call_tool(
             name: str, arguments: dict | None
         ) -> list[types.TextContent]:
+            fn = self._dispatch.get(name)
+            if fn is None:
+                return [types.TextContent(type="text", text=f"Error: Unknown tool: {name}")]
+
             try:
-                if name == "search_jobs":
-                    result = await self._search_jobs(arguments)
-                elif name == "get_job_details":
-                    result = await self._get_job_details(arguments)
-                elif name == "search_companies":
-                    result = await self._search_companies(arguments)
-                elif name == "get_company_jobs":
-                    result = await self._get_company_jobs(arguments)
-                elif name == "analyze_job_market":
-                    result = await self._analyze_job_market(arguments)
-                else:
-                    raise ValueError(f"Unknown tool: {name}")
-                
+                result = await fn(arguments or {})
                 return [types.TextContent(type="text", text=result)]
             except Exception as e:
                 return [types.TextContent(type="text", text=f"Error: {str(e)}\n\nPlease try again or adjust your search criteria.")]
     
-    async def _search_jobs(self, args: dict) -> str:
-        """Search for jobs using LinkedIn's public job search"""
-        keywords = args.get("keywords", "")
-        location = args.get("location", "")
-        experience_level = args.get("experience_level", "")
-        posted_time = args.get("posted_time", "past_month")
-        job_type = args.get("job_type", "")
-        remote = args.get("remote", False)
-        limit = min(args.get("limit", 25), 100)
-        
-        # Build LinkedIn job search URL
+    def _cache_put(self, key: str, value: str, now: float):
+        """Store a cache entry, pruning expired entries once the cache grows"""
+        if len(self._cache) > 512:
+            expired = [k for k, (ts, _) in self._cache.items() if now - ts >= self._cache_ttl]
+            for k in expired:
+                del self._cache[k]
+            if len(self._cache) > 512:
+                # Rough LRU: drop the oldest entry (insertion order)
+                self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (now, value)
+
+    async def _cached_get(self, url: str) -> str:
+        """GET a URL, serving repeated requests from a small in-process TTL cache"""
+        now = time.monotonic()
+        cached = self._cache.get(url)
+        if cached and now - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        async def fetch() -> str:
+            for attempt in range(5):
+                await self._limiter.acquire()
+                response = await self.http_client.get(url)
+                if response.status_code in _RETRY_STATUSES and attempt < 4:
+                    # Back off and retry when LinkedIn throttles or hiccups
+                    await asyncio.sleep(_retry_delay(attempt, response.headers.get("Retry-After")))
+                    continue
+                response.raise_for_status()
+                break
+
+            self._cache_put(url, response.text, now)
+            return response.text
+
+        return await self._coalesced(url, fetch)
+
+    async def _coalesced(self, key: str, factory):
+        """Share a single in-flight fetch among callers requesting the same resource"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._inflight.pop(k, None))
+        return await task
+
+    async def _bounded(self, fn, *args):
+        """Run a coroutine under the shared fan-out semaphore"""
+        async with self._fanout_sem:
+            return await fn(*args)
+
+    async def _fetch_listing_html(self, url: str, max_cards: int = 25) -> str:
+        """Stream a listing page, stopping the download once enough job cards arrived"""
+        now = time.monotonic()
+        cached = self._cache.get(url)
+        if cached and now - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        async def fetch() -> str:
+            for attempt in range(5):
+                chunks = []
+                cards_seen = 0
+
+                await self._limiter.acquire()
+                try:
+                    async with self.http_client.stream('GET', url) as response:
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes(65536):
+                            chunks.append(chunk)
+                            cards_seen += chunk.count(b'base-search-card__title')
+                            if cards_seen > max_cards:
+                                # Enough card subtrees are buffered; skip the page
+                                # footer and script payloads after the results list
+                                break
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code in _RETRY_STATUSES and attempt < 4:
+                        await asyncio.sleep(_retry_delay(attempt, e.response.headers.get("Retry-After")))
+                        continue
+                    raise
+                break
+
+            text = b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
+
+            self._cache_put(url, text, now)
+            return text
+
+        return await self._coalesced(url, fetch)
+
+    def _build_search_params(self, args: dict) -> dict:
+        """Build the LinkedIn job search query parameters for a tool call"""
+        get = args.get
         params = {
-            "keywords": keywords,
-            "location": location,
-            "f_TPR": self._map_time_filter(posted_time),
-            "f_E": self._map_experience_level(experience_level),
-            "f_JT": self._map_job_type(job_type),
-            "position": 1,
-            "pageNum": 0
+            "keywords": get("keywords", ""),
+            "location": get("location", ""),
+            "f_TPR": _TIME_FILTER.get(get("posted_time", "past_month"), "r2592000"),
+            "f_E": _EXPERIENCE_LEVEL.get(get("experience_level", ""), ""),
+            "f_JT": _JOB_TYPE.get(get("job_type", ""), "")
         }
-        
-        if remote:
+
+        if get("remote"):
             params["f_WT"] = "2"  # Remote filter
-        
+
         # Remove empty params
-        params = {k: v for k, v in params.items() if v}
-        
-        url = f"https://www.linkedin.com/jobs/search/?{urlencode(params)}"
-        
+        return {k: v for k, v in params.items() if v}
+
+    async def _collect_jobs(self, args: dict, pages: int = 1) -> list[dict]:
+        """Collect structured job listings, optionally across several pages"""
+        # Encode the shared query string once; pages only differ in start/pageNum
+        base_qs = urlencode(self._build_search_params(args))
+
+        if pages == 1:
+            return await self._fetch_jobs_page(base_qs)
+
+        results = await asyncio.gather(
+            *[self._bounded(self._fetch_jobs_page, base_qs, i) for i in range(pages)],
+            return_exceptions=True
+        )
+
+        # Merge pages, dropping listings that appear on more than one page
+        seen = set()
+        jobs = []
+        for page in results:
+            if isinstance(page, BaseException):
+                continue
+            for job in page:
+                key = job.get('url') or job['title']
+                if key not in seen:
+                    seen.add(key)
+                    jobs.append(job)
+        return jobs
+
+    async def _search_jobs(self, args: dict) -> str:
+        """Search for jobs using LinkedIn's public job search"""
+        get = args.get
+        keywords = get("keywords", "")
+        location = get("location", "")
+        experience_level = get("experience_level", "")
+        posted_time = get("posted_time", "past_month")
+        limit = get("limit", 25)
+
+        url = f"{_SEARCH_URL}?{urlencode(self._build_search_params(args))}"
+
         try:
-            response = await self.http_client.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract job listings
-            jobs = []
-            job_cards = soup.find_all('div', class_='base-card')[:limit]
-            
-            if not job_cards:
-                # Try alternative selectors
-                job_cards = soup.find_all('li', class_='jobs-search__results-list')[:limit]
-            
-            for card in job_cards:
-                try:
-                    job_data = self._parse_job_card(card)
-                    if job_data:
-                        jobs.append(job_data)
-                except Exception as e:
-                    continue
-            
+            jobs = (await self._collect_jobs(args))[:limit]
+
             if not jobs:
                 return f"No jobs found for '{keywords}'" + (f" in {location}" if location else "") + f"\n\nTry broadening your search or different keywords.\nSearch URL: {url}"
             
             # Format results
-            result = f"🔍 Found {len(jobs)} jobs for '{keywords}'"
+            parts = [f"🔍 Found {len(jobs)} jobs for '{keywords}'"]
             if location:
-                result += f" in {location}"
+                parts.append(f" in {location}")
             if experience_level:
-                result += f" ({experience_level.replace('_', ' ')} level)"
-            result += f"\n📅 Posted: {posted_time.replace('_', ' ')}\n"
-            result += f"🔗 Full search: {url}\n\n"
-            
-            for i, job in enumerate(jobs, 1):
-                result += f"{i}. 💼 {job['title']}\n"
-                result += f"   🏢 {job['company']}\n"
-                result += f"   📍 {job['location']}\n"
-                if job.get('posted_date'):
-                    result += f"   📅 Posted: {job['posted_date']}\n"
-                result += f"   🔗 {job['url']}\n\n"
-            
-            return result
+                parts.append(f" ({experience_level.replace('_', ' ')} level)")
+            parts.append(f"\n📅 Posted: {posted_time.replace('_', ' ')}\n")
+            parts.append(f"🔗 Full search: {url}\n\n")
+
+            parts.extend(self._format_job_entry(job, i) for i, job in enumerate(jobs, 1))
+
+            return ''.join(parts)
             
         except Exception as e:
             return f"Error searching jobs: {str(e)}\n\nSearch URL attempted: {url}\n\nTip: LinkedIn may be blocking automated requests. Try using different search terms or check the URL manually."
-    
+
+    async def _fetch_jobs_page(self, base_qs: str, page_num: int = 0) -> list[dict]:
+        """Fetch and parse a single page of LinkedIn job search results"""
+        url = f"{_SEARCH_PATH}?{base_qs}&start={page_num * 25}&pageNum={page_num}"
+
+        tree = HTMLParser(await self._fetch_listing_html(url))
+
+        job_cards = []
+        for selector in _CARD_SELECTORS:
+            job_cards = tree.css(selector)
+            if job_cards:
+                break
+
+        jobs = []
+        for card in job_cards:
+            try:
+                job_data = self._parse_job_card(card)
+                if job_data:
+                    jobs.append(job_data)
+            except Exception:
+                continue
+
+        return jobs
+
+    def _format_job_entry(self, job: dict, i: int) -> str:
+        """Format a single job listing for tool output"""
+        lines = [
+            f"{i}. 💼 {job['title']}\n",
+            f"   🏢 {job['company']}\n",
+            f"   📍 {job['location']}\n"
+        ]
+        if job.get('posted_date'):
+            lines.append(f"   📅 Posted: {job['posted_date']}\n")
+        lines.append(f"   🔗 {job['url']}\n\n")
+        return ''.join(lines)
+
     def _parse_job_card(self, card) -> dict:
-        """Extract job information from a job card"""
+        """Extract job information from a job card node"""
         job = {}
-        
-        # Try multiple selectors for robustness
-        title_elem = card.find('h3', class_='base-search-card__title') or \
-                    card.find('a', class_='base-card__full-link')
-        
-        if title_elem:
-            job['title'] = title_elem.get_text(strip=True)
-            job['url'] = title_elem.get('href', '') if title_elem.name == 'a' else \
-                        card.find('a', class_='base-card__full-link').get('href', '')
-        else:
+
+        # Try multiple selectors for robustness; look the link up once since it
+        # serves as both the title fallback and the href source
+        link_elem = card.css_first('a.base-card__full-link')
+        title_elem = card.css_first('h3.base-search-card__title') or link_elem
+
+        if title_elem is None:
             return None
-        
-        company_elem = card.find('h4', class_='base-search-card__subtitle') or \
-                      card.find('a', class_='hidden-nested-link')
-        job['company'] = company_elem.get_text(strip=True) if company_elem else "Company not listed"
-        
-        location_elem = card.find('span', class_='job-search-card__location')
-        job['location'] = location_elem.get_text(strip=True) if location_elem else "Location not specified"
-        
-        date_elem = card.find('time', class_='job-search-card__listdate')
-        job['posted_date'] = date_elem.get_text(strip=True) if date_elem else ""
-        
+        job['title'] = title_elem.text(strip=True)
+        job['url'] = (link_elem.attributes.get('href') or '') if link_elem else ''
+
+        company_elem = card.css_first('h4.base-search-card__subtitle') or \
+                      card.css_first('a.hidden-nested-link')
+        job['company'] = company_elem.text(strip=True) if company_elem else "Company not listed"
+
+        location_elem = card.css_first('span.job-search-card__location')
+        job['location'] = location_elem.text(strip=True) if location_elem else "Location not specified"
+
+        date_elem = card.css_first('time.job-search-card__listdate')
+        job['posted_date'] = date_elem.text(strip=True) if date_elem else ""
+
         return job if job.get('title') else None
     
+    async def _stream_job_fields(self, url: str) -> dict:
+        """Stream a job-view page, stopping once the fields we need are parsed"""
+        for attempt in range(5):
+            fields = {}
+            parser = etree.HTMLPullParser(events=('end',))
+
+            await self._limiter.acquire()
+            try:
+                async with self.http_client.stream('GET', url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(65536):
+                        parser.feed(chunk)
+                        for _, elem in parser.read_events():
+                            entry = _DETAIL_FIELDS.get(elem.tag)
+                            if entry is None:
+                                continue
+                            marker, field = entry
+                            if field in fields or marker not in (elem.get('class') or ''):
+                                continue
+                            if field == 'description':
+                                fields[field] = '\n'.join(
+                                    t.strip() for t in elem.itertext() if t.strip()
+                                )
+                            else:
+                                fields[field] = ''.join(elem.itertext()).strip()
+                        if 'description' in fields:
+                            # The description is the last field we need; stop
+                            # downloading before the footer and scripts arrive
+                            return fields
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code in _RETRY_STATUSES and attempt < 4:
+                    await asyncio.sleep(_retry_delay(attempt, e.response.headers.get("Retry-After")))
+                    continue
+                raise
+            break
+
+        return fields
+
     async def _get_job_details(self, args: dict) -> str:
         """Get detailed job information"""
         job_url_or_id = args.get("job_url_or_id", "")
-        
+
         # Extract job ID if URL provided
-        if "linkedin.com" in job_url_or_id:
-            job_id = job_url_or_id.split("/view/")[-1].split("?")[0]
-        else:
-            job_id = job_url_or_id
-        
-        url = f"https://www.linkedin.com/jobs/view/{job_id}"
-        
+        match = _JOB_ID_RE.search(job_url_or_id)
+        job_id = match.group(1) if match else job_url_or_id.strip()
+
+        path = f"/jobs/view/{job_id}"
+        url = f"{_BASE_URL}{path}"
+
+        now = time.monotonic()
+        cached = self._cache.get(url)
+        if cached and now - cached[0] < self._cache_ttl:
+            return cached[1]
+
         try:
-            response = await self.http_client.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract job details
-            title = soup.find('h1', class_='top-card-layout__title')
-            company = soup.find('a', class_='topcard__org-name-link')
-            location = soup.find('span', class_='topcard__flavor--bullet')
-            description = soup.find('div', class_='show-more-less-html__markup')
-            
-            result = f"📋 Job Details:\n\n"
-            result += f"Title: {title.get_text(strip=True) if title else 'N/A'}\n"
-            result += f"Company: {company.get_text(strip=True) if company else 'N/A'}\n"
-            result += f"Location: {location.get_text(strip=True) if location else 'N/A'}\n"
-            result += f"URL: {url}\n\n"
-            
-            if description:
-                result += f"Description:\n{description.get_text(separator='\n', strip=True)}\n"
+            fields = await self._stream_job_fields(path)
+
+            parts = [
+                "📋 Job Details:\n\n",
+                f"Title: {fields.get('title', 'N/A')}\n",
+                f"Company: {fields.get('company', 'N/A')}\n",
+                f"Location: {fields.get('location', 'N/A')}\n",
+                f"URL: {url}\n\n"
+            ]
+
+            if fields.get('description'):
+                parts.append(f"Description:\n{fields['description']}\n")
             else:
-                result += "Description: Not available (may require login)\n"
-            
+                parts.append("Description: Not available (may require login)\n")
+
+            result = ''.join(parts)
+            self._cache_put(url, result, now)
             return result
-            
+
         except Exception as e:
             return f"Error fetching job details: {str(e)}\n\nURL: {url}\n\nNote: Full job descriptions may require LinkedIn login."
     
+    async def _get_job_details_bulk(self, job_ids: list[str]) -> list[str]:
+        """Fetch several job detail pages concurrently"""
+        results = await asyncio.gather(
+            *[self._bounded(self._get_job_details, {"job_url_or_id": job_id}) for job_id in job_ids],
+            return_exceptions=True
+        )
+        return [str(r) for r in results]
+
     async def _search_companies(self, args: dict) -> str:
         """Search for companies"""
         company_name = args.get("company_name", "")
         
-        url = f"https://www.linkedin.com/company/{quote_plus(company_name.lower().replace(' ', '-'))}"
-        
+        path = f"/company/{quote_plus(company_name.lower().replace(' ', '-'))}"
+        url = f"{_BASE_URL}{path}"
+
         try:
-            response = await self.http_client.get(url)
-            
-            if response.status_code == 200:
-                return f"✅ Found company: {company_name}\n🔗 {url}\n\nUse 'get_company_jobs' to see their job openings."
-            else:
-                return f"❌ Company '{company_name}' not found at standard URL.\n\nTry searching manually: https://www.linkedin.com/search/results/companies/?keywords={quote_plus(company_name)}"
-                
+            await self._cached_get(path)
+            return f"✅ Found company: {company_name}\n🔗 {url}\n\nUse 'get_company_jobs' to see their job openings."
+        except httpx.HTTPStatusError:
+            return f"❌ Company '{company_name}' not found at standard URL.\n\nTry searching manually: https://www.linkedin.com/search/results/companies/?keywords={quote_plus(company_name)}"
         except Exception as e:
             return f"Error searching company: {str(e)}"
     
     async def _get_company_jobs(self, args: dict) -> str:
         """Get jobs from a specific company"""
         company_name = args.get("company_name", "")
-        limit = min(args.get("limit", 25), 100)
-        
+        limit = args.get("limit", 25)
+
         # Search for jobs at the company
-        return await self._search_jobs({
-            "keywords": f"{company_name}",
-            "limit": limit
-        })
+        jobs = (await self._collect_jobs({"keywords": company_name}))[:limit]
+
+        if not jobs:
+            return f"No jobs found for '{company_name}'\n\nTry a different company name or check the spelling."
+
+        parts = [f"💼 Found {len(jobs)} jobs matching '{company_name}'\n\n"]
+        parts.extend(self._format_job_entry(job, i) for i, job in enumerate(jobs, 1))
+
+        # Enrich the first few results with full detail pages, fetched concurrently
+        job_ids = [m.group(1) for m in (_JOB_ID_RE.search(j.get('url', '')) for j in jobs) if m]
+        if job_ids:
+            details = await self._get_job_details_bulk(job_ids[:10])
+            parts.append("\n" + "\n---\n".join(details))
+
+        return ''.join(parts)
     
     async def _analyze_job_market(self, args: dict) -> str:
         """Analyze job market trends"""
         role = args.get("role", "")
         location = args.get("location", "")
-        
-        # Search with high limit to get market data
-        jobs_result = await self._search_jobs({
+
+        # Fetch several result pages concurrently to gather market data
+        jobs = await self._collect_jobs({
             "keywords": role,
             "location": location,
-            "limit": 100,
             "posted_time": "past_month"
-        })
-        
-        # Parse the results to extract insights
-        lines = jobs_result.split('\n')
-        job_count = 0
-        companies = {}
-        locations = {}
-        
-        for line in lines:
-            if line.strip().startswith('🏢'):
-                company = line.split('🏢')[-1].strip()
-                companies[company] = companies.get(company, 0) + 1
-                job_count += 1
-            elif line.strip().startswith('📍'):
-                loc = line.split('📍')[-1].strip()
-                locations[loc] = locations.get(loc, 0) + 1
-        
-        result = f"📊 Job Market Analysis for '{role}'"
+        }, pages=_ANALYSIS_PAGES)
+
+        # Counting and formatting hundreds of jobs is pure CPU work; run it
+        # off the event loop so concurrent tool calls keep being serviced
+        return await asyncio.to_thread(self._aggregate_market, jobs, role, location)
+
+    def _aggregate_market(self, jobs: list[dict], role: str, location: str) -> str:
+        """Aggregate collected jobs into the market analysis report"""
+        # Aggregate structured job data directly
+        job_count = len(jobs)
+        companies = Counter(job['company'] for job in jobs if job.get('company'))
+        locations = Counter(job['location'] for job in jobs if job.get('location'))
+
+        parts = [f"📊 Job Market Analysis for '{role}'"]
         if location:
-            result += f" in {location}"
-        result += f"\n\n"
-        result += f"📈 Total Active Postings: {job_count}\n"
-        result += f"📅 Time Period: Past 30 days\n\n"
-        
+            parts.append(f" in {location}")
+        parts.append("\n\n")
+        parts.append(f"📈 Total Active Postings: {job_count}\n")
+        parts.append("📅 Time Period: Past 30 days\n\n")
+
         if companies:
-            result += "🏆 Top Hiring Companies:\n"
-            for company, count in sorted(companies.items(), key=lambda x: x[1], reverse=True)[:10]:
-                result += f"   • {company}: {count} opening(s)\n"
-            result += "\n"
-        
+            parts.append("🏆 Top Hiring Companies:\n")
+            for company, count in companies.most_common(10):
+                parts.append(f"   • {company}: {count} opening(s)\n")
+            parts.append("\n")
+
         if locations:
-            result += "🌍 Top Locations:\n"
-            for loc, count in sorted(locations.items(), key=lambda x: x[1], reverse=True)[:10]:
-                result += f"   • {loc}: {count} opening(s)\n"
-        
-        return result
-    
-    def _map_time_filter(self, posted_time: str) -> str:
-        """Map time filter to LinkedIn parameter"""
-        mapping = {
-            "past_24h": "r86400",
-            "past_week": "r604800",
-            "past_month": "r2592000",
-            "any_time": ""
-        }
-        return mapping.get(posted_time, "r2592000")
-    
-    def _map_experience_level(self, level: str) -> str:
-        """Map experience level to LinkedIn parameter"""
-        mapping = {
-            "internship": "1",
-            "entry_level": "2",
-            "associate": "3",
-            "mid_senior": "4",
-            "director": "5",
-            "executive": "6"
-        }
-        return mapping.get(level, "")
-    
-    def _map_job_type(self, job_type: str) -> str:
-        """Map job type to LinkedIn parameter"""
-        mapping = {
-            "full_time": "F",
-            "part_time": "P",
-            "contract": "C",
-            "temporary": "T",
-            "internship": "I",
-            "volunteer": "V"
-        }
-        return mapping.get(job_type, "")
+            parts.append("🌍 Top Locations:\n")
+            for loc, count in locations.most_common(10):
+                parts.append(f"   • {loc}: {count} opening(s)\n")
+
+        return ''.join(parts)
     
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections"""
+        await self.http_client.aclose()
+
     async def run(self):
         """Run the MCP server"""
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="linkedin-mcp-server",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=NotificationOptions(),
-                        experimental_capabilities={},
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name="linkedin-mcp-server",
+                        server_version="1.0.0",
+                        capabilities=self.server.get_capabilities(
+                            notification_options=NotificationOptions(),
+                            experimental_capabilities={},
+                        ),
                     ),
-                ),
-            )
+                )
+        finally:
+            await self.aclose()
 
 async def main():
     server = LinkedInMCPServer()
     await server.run()
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
\ No newline at end of file